@@ -0,0 +1,63 @@
+"""
+Numeric kernels for the Adaptive Questionnaire Engine.
+Compiled with Numba when it is installed; callers fall back to pure Python otherwise.
+
+Author: BullDawg Hackers
+Date: October 2025
+"""
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def entropy(scores):
+        """Sum of binary entropies (bits) for an array of 0-100 scores"""
+        total = 0.0
+        for i in range(scores.size):
+            p = scores[i] / 100.0
+            if p > 0.0 and p < 1.0:
+                total -= p * math.log2(p) + (1.0 - p) * math.log2(1.0 - p)
+        return total
+
+    @njit(cache=True, fastmath=True)
+    def expected_entropy(scores, deltas, weights):
+        """
+        Expected entropy after answering a question.
+
+        Args:
+            scores: Current scores, shape (B,)
+            deltas: Score adjustment for each choice, shape (C, B)
+            weights: Probability of each choice, shape (C,)
+        """
+        expected = 0.0
+        for c in range(deltas.shape[0]):
+            total = 0.0
+            for i in range(scores.size):
+                s = scores[i]
+                if deltas[c, i] != 0.0:
+                    s = min(max(s + deltas[c, i], 0.0), 100.0)
+                p = s / 100.0
+                if p > 0.0 and p < 1.0:
+                    total -= p * math.log2(p) + (1.0 - p) * math.log2(1.0 - p)
+            expected += weights[c] * total
+        return expected
+
+    def warm_up():
+        """Compile (or load from cache) every kernel specialization the engine uses"""
+        import numpy as np
+        scores = np.full(2, 50.0)
+        weights = np.array([0.5, 0.5])
+        entropy(scores)
+        # Bank questions pass read-only table rows; other questions pass fresh arrays
+        deltas = np.zeros((2, 2))
+        expected_entropy(scores, deltas, weights)
+        deltas.flags.writeable = False
+        expected_entropy(scores, deltas, weights)
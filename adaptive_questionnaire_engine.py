@@ -7,11 +7,23 @@ Date: October 2025
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence, Iterator, Collection, Callable
 from dataclasses import dataclass, field
+from collections.abc import MutableMapping
 from enum import Enum
+import functools
 import json
 import math
+import re
+
+from _fastmath import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from _fastmath import entropy as _entropy_kernel, expected_entropy as _expected_entropy_kernel
+    from _fastmath import warm_up as _warm_up_kernels
+
+# Kernels are compiled on first engine construction rather than at import
+_kernels_warm = not NUMBA_AVAILABLE
 
 
 # ============================================================================
@@ -39,7 +51,14 @@ class BenefitType(Enum):
     COMMUTER_BENEFITS = "commuter_benefits"
 
 
-@dataclass
+# Enum iteration goes through EnumMeta.__iter__; hot paths use this tuple instead
+_BT_TUPLE: Tuple[BenefitType, ...] = tuple(BenefitType)
+
+# Position of each benefit in score arrays
+_BT_INDEX: Dict[BenefitType, int] = {bt: i for i, bt in enumerate(_BT_TUPLE)}
+
+
+@dataclass(slots=True, frozen=True)
 class UserDemographics:
     """Demographics from Google API"""
     name: str
@@ -51,7 +70,7 @@ class UserDemographics:
     num_children: int = 0
     
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserFinancials:
     """Financial data from Plaid API"""
     annual_income: float
@@ -63,7 +82,7 @@ class UserFinancials:
     income_volatility: float = 0.0  # Standard deviation
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Question:
     """Represents a binary choice question"""
     id: str
@@ -74,9 +93,17 @@ class Question:
     correlations_b: Dict[BenefitType, float]
     dimensions: List[str]
     expected_ig: float = 0.0
+    # Derived from the static text once, at construction
+    choices_lower: Tuple[str, str] = field(init=False, repr=False, compare=False)
+    keyword_tags: frozenset = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        text_lower = self.text.lower()
+        object.__setattr__(self, "choices_lower", (self.choice_a.lower(), self.choice_b.lower()))
+        object.__setattr__(self, "keyword_tags", frozenset(re.findall(r"\w+", text_lower)))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Answer:
     """User's answer to a question"""
     question_id: str
@@ -95,6 +122,58 @@ class BenefitRecommendation:
     rationale: str
 
 
+class RecommendationList(list):
+    """Recommendations sorted by score (descending), with per-priority subsets"""
+    
+    def __init__(
+        self,
+        recommendations: Sequence[BenefitRecommendation] = (),
+        critical: Sequence[BenefitRecommendation] = (),
+        recommended: Sequence[BenefitRecommendation] = (),
+        optional: Sequence[BenefitRecommendation] = ()
+    ):
+        super().__init__(recommendations)
+        self.critical = list(critical)
+        self.recommended = list(recommended)
+        self.optional = list(optional)
+
+
+class BenefitScores(MutableMapping):
+    """Dict-style view of a score array, keyed by BenefitType"""
+    
+    __slots__ = ("array",)
+    
+    def __init__(self, array: np.ndarray):
+        self.array = array
+    
+    def __getitem__(self, benefit: BenefitType) -> float:
+        return float(self.array[_BT_INDEX[benefit]])
+    
+    def __setitem__(self, benefit: BenefitType, score: float):
+        self.array[_BT_INDEX[benefit]] = score
+    
+    def __delitem__(self, benefit: BenefitType):
+        raise TypeError("Benefit scores cannot be removed")
+    
+    def __iter__(self) -> Iterator[BenefitType]:
+        return iter(_BT_TUPLE)
+    
+    def __len__(self) -> int:
+        return len(_BT_TUPLE)
+    
+    def items(self) -> List[Tuple[BenefitType, float]]:
+        return list(zip(_BT_TUPLE, self.array.tolist()))
+    
+    def values(self) -> List[float]:
+        return self.array.tolist()
+    
+    def copy(self) -> Dict[BenefitType, float]:
+        return dict(self.items())
+    
+    def __repr__(self) -> str:
+        return f"BenefitScores({self.copy()!r})"
+
+
 # ============================================================================
 # CORRELATION MATRICES
 # ============================================================================
@@ -320,6 +399,30 @@ def build_question_bank() -> List[Question]:
     return questions
 
 
+# Questions are immutable, so every engine shares one bank and its lookup tables
+QUESTION_BANK: Tuple[Question, ...] = tuple(build_question_bank())
+
+# Index question text by keyword for constant-time lookups
+_KEYWORD_INDEX: Dict[str, List[Question]] = {}
+for _question in QUESTION_BANK:
+    for _word in _question.keyword_tags:
+        _KEYWORD_INDEX.setdefault(_word, []).append(_question)
+
+# Dense correlation table: [question, choice (A/B), benefit]
+_QID_TO_IDX: Dict[str, int] = {q.id: i for i, q in enumerate(QUESTION_BANK)}
+_DELTA_TABLE = np.zeros((len(QUESTION_BANK), 2, len(_BT_TUPLE)), dtype=np.float64)
+for _i, _question in enumerate(QUESTION_BANK):
+    for _c, _correlations in enumerate((_question.correlations_a, _question.correlations_b)):
+        for _benefit, _correlation in _correlations.items():
+            _DELTA_TABLE[_i, _c, _BT_INDEX[_benefit]] = _correlation
+_DELTA_TABLE.flags.writeable = False
+
+# Simulated score shift for every (question, choice, benefit), as in simulate_answer
+_IG_DELTAS = _DELTA_TABLE * 10.0
+_IG_DELTAS.flags.writeable = False
+_IG_MOVED = _IG_DELTAS != 0.0
+
+
 # ============================================================================
 # DEMOGRAPHIC PRIORS
 # ============================================================================
@@ -436,6 +539,52 @@ def adjust_priors_with_financials(
     return adjusted
 
 
+@functools.lru_cache(maxsize=1024)
+def _initial_scores(
+    age: int,
+    marital_status: Optional[str],
+    num_children: int,
+    annual_income: float,
+    total_debt: float,
+    savings: float,
+    investment_accounts: float,
+    healthcare_spend: float
+) -> Tuple[float, ...]:
+    """
+    Prior scores in _BT_TUPLE order for the profile fields the priors depend on.
+    Cached so repeated or identical profiles skip the rule cascade.
+    """
+    # Only the fields read by the prior functions matter; the rest are placeholders
+    demographics = UserDemographics(
+        name="", age=age, gender="", location="", zip_code="",
+        marital_status=marital_status, num_children=num_children
+    )
+    financials = UserFinancials(
+        annual_income=annual_income,
+        monthly_expenses=0.0,
+        total_debt=total_debt,
+        savings=savings,
+        investment_accounts=investment_accounts,
+        spending_categories={"healthcare": healthcare_spend}
+    )
+    priors = adjust_priors_with_financials(get_demographic_priors(demographics), financials)
+    return tuple(priors[bt] for bt in _BT_TUPLE)
+
+
+def _profile_key(demographics: UserDemographics, financials: UserFinancials) -> tuple:
+    """Arguments for _initial_scores taken from a user profile"""
+    return (
+        demographics.age,
+        demographics.marital_status,
+        demographics.num_children,
+        financials.annual_income,
+        financials.total_debt,
+        financials.savings,
+        financials.investment_accounts,
+        financials.spending_categories.get("healthcare", 0)
+    )
+
+
 # ============================================================================
 # INFORMATION GAIN CALCULATION
 # ============================================================================
@@ -450,6 +599,12 @@ def calculate_entropy(benefit_scores: Dict[BenefitType, float]) -> float:
     Returns:
         float: Entropy in bits
     """
+    if NUMBA_AVAILABLE:
+        if isinstance(benefit_scores, BenefitScores):
+            return _entropy_kernel(benefit_scores.array)
+        scores = np.fromiter(benefit_scores.values(), dtype=np.float64, count=len(benefit_scores))
+        return _entropy_kernel(scores)
+    
     entropy = 0.0
     
     for score in benefit_scores.values():
@@ -466,11 +621,15 @@ def calculate_entropy(benefit_scores: Dict[BenefitType, float]) -> float:
 def calculate_information_gain(
     question: Question,
     current_scores: Dict[BenefitType, float],
-    question_history: List[str]
+    question_history: Collection[str],
+    current_entropy: Optional[float] = None
 ) -> float:
     """
     Calculate expected information gain for asking this question.
     
+    Args:
+        current_entropy: Precomputed entropy of current_scores, if available
+    
     Returns:
         float: Expected information gain in bits
     """
@@ -478,7 +637,25 @@ def calculate_information_gain(
     if question.id in question_history:
         return 0.0
     
-    current_entropy = calculate_entropy(current_scores)
+    if current_entropy is None:
+        current_entropy = calculate_entropy(current_scores)
+    
+    if NUMBA_AVAILABLE:
+        if isinstance(current_scores, BenefitScores):
+            scores = current_scores.array
+        else:
+            scores = np.array([current_scores[bt] for bt in _BT_TUPLE], dtype=np.float64)
+        # Table rows only describe the bank's own questions
+        idx = _QID_TO_IDX.get(question.id)
+        if idx is not None and QUESTION_BANK[idx] is question:
+            deltas = _IG_DELTAS[idx]
+        else:
+            deltas = np.array([
+                [question.correlations_a.get(bt, 0.0) for bt in _BT_TUPLE],
+                [question.correlations_b.get(bt, 0.0) for bt in _BT_TUPLE]
+            ]) * 10.0
+        expected_entropy = _expected_entropy_kernel(scores, deltas, np.array([0.5, 0.5]))
+        return max(current_entropy - expected_entropy, 0.0)
     
     # Estimate probability of each choice (assume 50-50 for simplicity)
     p_choice_a = 0.5
@@ -519,6 +696,103 @@ def simulate_answer(
     return simulated
 
 
+# ============================================================================
+# COVERAGE FORMULAS
+# ============================================================================
+
+def _life_details(score: float, demographics: UserDemographics, financials: UserFinancials) -> Dict:
+    # Life insurance: 8-10x income
+    base = financials.annual_income * 8
+    multiplier = 1 + (score - 50) / 100
+    coverage = base * multiplier + (demographics.num_children * 100000)
+    
+    return {
+        "coverage_amount": round(coverage, -3),
+        "type": "Term Life",
+        "duration": f"{min(65 - demographics.age, 30)} years",
+        "estimated_monthly_premium": round(coverage / 10000 * 7, 0)
+    }
+
+
+def _disability_details(score: float, demographics: UserDemographics, financials: UserFinancials) -> Dict:
+    monthly_benefit = (financials.annual_income / 12) * (0.60 + score/500)
+    
+    return {
+        "monthly_benefit": round(monthly_benefit, -2),
+        "elimination_period": "90 days",
+        "benefit_period": "To age 65",
+        "estimated_monthly_premium": round(monthly_benefit * 0.02, 0)
+    }
+
+
+def _medical_details(score: float, demographics: UserDemographics, financials: UserFinancials) -> Dict:
+    if score >= 75:
+        return {
+            "plan_type": "PPO Low Deductible",
+            "tier": "Gold",
+            "deductible": 1000,
+            "out_of_pocket_max": 5000,
+            "estimated_monthly_premium": 450
+        }
+    elif score >= 50:
+        return {
+            "plan_type": "PPO Standard",
+            "tier": "Silver",
+            "deductible": 2500,
+            "out_of_pocket_max": 7000,
+            "estimated_monthly_premium": 350
+        }
+    else:
+        return {
+            "plan_type": "HDHP + HSA",
+            "tier": "Bronze",
+            "deductible": 5000,
+            "out_of_pocket_max": 8000,
+            "estimated_monthly_premium": 250
+        }
+
+
+def _hsa_details(score: float, demographics: UserDemographics, financials: UserFinancials) -> Dict:
+    # Max contribution based on family status
+    max_contribution = 8300 if demographics.num_children > 0 else 4150
+    recommended = min(max_contribution, financials.annual_income * 0.05)
+    
+    return {
+        "recommended_annual_contribution": round(recommended, -2),
+        "tax_savings": round(recommended * 0.22, 0),  # Assume 22% bracket
+        "investment_options": "Yes"
+    }
+
+
+def _retirement_401k_details(score: float, demographics: UserDemographics, financials: UserFinancials) -> Dict:
+    # Contribute enough to get full match
+    recommended_rate = min(15, max(6, score / 6))  # 6-15% of income
+    
+    return {
+        "recommended_contribution_rate": f"{round(recommended_rate)}%",
+        "annual_amount": round(financials.annual_income * recommended_rate / 100, -2),
+        "employer_match": "Up to 6%"
+    }
+
+
+def _generic_details(score: float, demographics: UserDemographics, financials: UserFinancials) -> Dict:
+    # Generic recommendation
+    return {
+        "coverage": "Standard" if score >= 50 else "Basic",
+        "estimated_monthly_premium": round(score * 0.5, 0)
+    }
+
+
+# Benefit-specific coverage formulas; anything not listed uses _generic_details
+COVERAGE_FORMULAS: Dict[BenefitType, Callable[[float, UserDemographics, UserFinancials], Dict]] = {
+    BenefitType.LIFE: _life_details,
+    BenefitType.DISABILITY: _disability_details,
+    BenefitType.MEDICAL: _medical_details,
+    BenefitType.HSA: _hsa_details,
+    BenefitType.RETIREMENT_401K: _retirement_401k_details,
+}
+
+
 # ============================================================================
 # ADAPTIVE QUESTIONING ENGINE
 # ============================================================================
@@ -531,18 +805,28 @@ class AdaptiveQuestionnaireEngine:
         demographics: UserDemographics,
         financials: UserFinancials
     ):
+        global _kernels_warm
+        if not _kernels_warm:
+            _warm_up_kernels()
+            _kernels_warm = True
+        
         self.demographics = demographics
         self.financials = financials
-        self.question_bank = build_question_bank()
+        self.question_bank = QUESTION_BANK
+        self._keyword_index = _KEYWORD_INDEX
+        self._qid_to_idx = _QID_TO_IDX
+        self._delta_table = _DELTA_TABLE
         
         # Initialize benefit scores with priors
-        self.benefit_scores = get_demographic_priors(demographics)
-        self.benefit_scores = adjust_priors_with_financials(self.benefit_scores, financials)
+        self._scores = np.array(_initial_scores(*_profile_key(demographics, financials)), dtype=np.float64)
+        self._score_view = BenefitScores(self._scores)
         
         # Track questioning
         self.questions_asked: List[Question] = []
         self.answers: List[Answer] = []
         self.question_history: List[str] = []
+        self._asked_mask = np.zeros(len(self.question_bank), dtype=bool)
+        self._derived: Dict[str, object] = {}  # Cleared whenever an answer is recorded
         
         # Configuration
         self.min_questions = 8
@@ -550,6 +834,114 @@ class AdaptiveQuestionnaireEngine:
         self.confidence_threshold = 0.85
         self.entropy_threshold = 0.3
     
+    # Module-level scoring functions, reachable from an engine instance
+    calculate_entropy = staticmethod(calculate_entropy)
+    calculate_information_gain = staticmethod(calculate_information_gain)
+    
+    @staticmethod
+    def score_profiles_batch(
+        demographics: Sequence[UserDemographics],
+        financials: Sequence[UserFinancials]
+    ) -> np.ndarray:
+        """
+        Initial benefit scores for many profiles without building engines.
+        
+        Args:
+            demographics: One UserDemographics per profile
+            financials: Matching UserFinancials per profile
+        
+        Returns:
+            np.ndarray of shape (profiles, benefits), columns ordered by BenefitType
+        """
+        if len(demographics) != len(financials):
+            raise ValueError("demographics and financials must have the same length")
+        
+        scores = np.empty((len(demographics), len(_BT_TUPLE)), dtype=np.float64)
+        for row, (demo, fin) in enumerate(zip(demographics, financials)):
+            scores[row] = _initial_scores(*_profile_key(demo, fin))
+        return scores
+    
+    def __copy__(self) -> "AdaptiveQuestionnaireEngine":
+        """
+        Clone the session state without rebuilding the question bank.
+        
+        The question bank, lookup tables and user profile are shared;
+        scores and answer history are copied.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._scores = self._scores.copy()
+        clone._score_view = BenefitScores(clone._scores)
+        clone.questions_asked = list(self.questions_asked)
+        clone.answers = list(self.answers)
+        clone.question_history = list(self.question_history)
+        clone._asked_mask = self._asked_mask.copy()
+        clone._derived = {}
+        return clone
+    
+    @property
+    def benefit_scores(self) -> BenefitScores:
+        """Current benefit scores (0-100), keyed by BenefitType"""
+        return self._score_view
+    
+    @benefit_scores.setter
+    def benefit_scores(self, scores: Dict[BenefitType, float]):
+        self._scores[:] = [scores[bt] for bt in _BT_TUPLE]
+    
+    @property
+    def scores_array(self) -> np.ndarray:
+        """Read-only view of the current scores, ordered by BenefitType"""
+        view = self._scores.view()
+        view.flags.writeable = False
+        return view
+    
+    @property
+    def asked_ids(self) -> frozenset:
+        """IDs of all questions answered so far"""
+        if "asked_ids" not in self._derived:
+            self._derived["asked_ids"] = frozenset(self.question_history)
+        return self._derived["asked_ids"]
+    
+    @property
+    def answer_history(self) -> List[str]:
+        """IDs of answered questions, in the order they were answered"""
+        return self.question_history
+    
+    def information_gain_all(self) -> np.ndarray:
+        """
+        Expected information gain of every question in the bank, in one pass.
+        
+        Returns:
+            Array of shape (num_questions,) aligned with question_bank;
+            questions already asked get 0.0
+        """
+        scores = self._scores
+        # Posterior scores for each (question, choice); only moved benefits are clipped
+        posterior = np.where(_IG_MOVED, np.clip(scores + _IG_DELTAS, 0.0, 100.0), scores)
+        p = posterior / 100.0
+        uncertain = (p > 0.0) & (p < 1.0)
+        p = np.where(uncertain, p, 0.5)
+        bits = np.where(uncertain, -(p * np.log2(p) + (1.0 - p) * np.log2(1.0 - p)), 0.0)
+        
+        # Both choices assumed equally likely
+        expected_entropy = bits.sum(axis=2).mean(axis=1)
+        gains = np.maximum(calculate_entropy(self.benefit_scores) - expected_entropy, 0.0)
+        gains[self._asked_mask] = 0.0
+        return gains
+    
+    def find_question(self, keyword: str) -> Optional[Question]:
+        """
+        Find the first question whose text contains the given keyword.
+        
+        Args:
+            keyword: Single word to look up (case-insensitive)
+        
+        Returns:
+            Question object or None if no question mentions the keyword
+        """
+        matches = self._keyword_index.get(keyword.lower())
+        return matches[0] if matches else None
+    
     def select_next_question(self) -> Optional[Question]:
         """
         Select the next question with maximum information gain.
@@ -561,25 +953,14 @@ class AdaptiveQuestionnaireEngine:
         if self.should_stop():
             return None
         
-        # Calculate IG for all unasked questions
-        question_igs = []
-        for question in self.question_bank:
-            if question.id not in self.question_history:
-                ig = calculate_information_gain(
-                    question,
-                    self.benefit_scores,
-                    self.question_history
-                )
-                question_igs.append((question, ig))
-        
         # No more questions available
-        if not question_igs:
+        if self._asked_mask.all():
             return None
         
-        # Select question with max IG
-        best_question = max(question_igs, key=lambda x: x[1])[0]
-        
-        return best_question
+        # Select question with max IG (first one on ties, in bank order)
+        gains = self.information_gain_all()
+        gains[self._asked_mask] = -1.0
+        return self.question_bank[int(gains.argmax())]
     
     def process_answer(self, question: Question, choice: str):
         """
@@ -597,23 +978,89 @@ class AdaptiveQuestionnaireEngine:
         )
         
         # Get correlations for chosen answer
-        correlations = question.correlations_a if choice == 'A' else question.correlations_b
+        choice_idx = 0 if choice == 'A' else 1
+        idx = self._qid_to_idx.get(question.id)
+        if idx is not None and self.question_bank[idx] is question:
+            deltas = self._delta_table[idx, choice_idx]
+        else:
+            correlations = question.correlations_a if choice == 'A' else question.correlations_b
+            deltas = np.array([correlations.get(bt, 0.0) for bt in _BT_TUPLE])
         
         # Bayesian update of benefit scores
         weight = answer.confidence_weight * 8.0  # Base weight
         
-        for benefit, correlation in correlations.items():
-            adjustment = correlation * weight
-            self.benefit_scores[benefit] = np.clip(
-                self.benefit_scores[benefit] + adjustment,
-                0,
-                100
-            )
+        self._scores += deltas * weight
+        np.clip(self._scores, 0, 100, out=self._scores)
         
         # Track
         self.questions_asked.append(question)
         self.answers.append(answer)
         self.question_history.append(question.id)
+        if idx is not None:
+            self._asked_mask[idx] = True
+        self._derived.clear()
+    
+    def snapshot(self) -> np.ndarray:
+        """
+        Copy current benefit scores into an array ordered by BenefitType.
+        
+        Returns:
+            np.ndarray of scores (0-100), one entry per benefit type
+        """
+        return self._scores.copy()
+    
+    def count_changed_scores(self, snapshot: np.ndarray) -> int:
+        """
+        Count benefits whose score differs from an earlier snapshot().
+        
+        Returns:
+            int: Number of changed benefit scores
+        """
+        return int(np.count_nonzero(self._scores != snapshot))
+    
+    def set_scores(
+        self,
+        value: float,
+        overrides: Optional[Dict[BenefitType, float]] = None
+    ):
+        """
+        Set every benefit score in place, then apply per-benefit overrides.
+        
+        Args:
+            value: Score (0-100) assigned to all benefits
+            overrides: Optional scores for specific benefits
+        """
+        self._scores.fill(value)
+        
+        if overrides:
+            for benefit, score in overrides.items():
+                self._scores[_BT_INDEX[benefit]] = score
+    
+    def run_simulation(
+        self,
+        policy_fn: Callable[[Question], object],
+        max_questions: Optional[int] = None
+    ) -> List[Question]:
+        """
+        Run a questioning session, asking policy_fn for each answer.
+        
+        Args:
+            policy_fn: Called with each selected question; returns the choice
+            max_questions: Optional cap on questions asked (defaults to self.max_questions)
+        
+        Returns:
+            List of questions asked before stopping
+        """
+        limit = self.max_questions if max_questions is None else max_questions
+        asked = []
+        while len(asked) < limit:
+            question = self.select_next_question()
+            if question is None:
+                break
+            self.process_answer(question, policy_fn(question))
+            asked.append(question)
+        
+        return asked
     
     def should_stop(self) -> bool:
         """
@@ -648,16 +1095,27 @@ class AdaptiveQuestionnaireEngine:
         
         return False
     
-    def generate_recommendations(self) -> List[BenefitRecommendation]:
+    def generate_recommendations(self) -> RecommendationList:
         """
         Generate final benefit recommendations based on scores.
         
         Returns:
-            List of BenefitRecommendation objects
+            RecommendationList of BenefitRecommendation objects, already sorted
+            by score descending; .critical, .recommended and .optional hold
+            those subsets
         """
-        recommendations = []
+        scores = self._scores.tolist()
+        rounded = [round(score, 1) for score in scores]
         
-        for benefit, score in self.benefit_scores.items():
+        # Visit benefits by score descending (stable, so ties keep enum order)
+        recommendations = []
+        by_priority: Dict[str, List[BenefitRecommendation]] = {
+            "critical": [], "recommended": [], "optional": []
+        }
+        for i in np.argsort(np.negative(rounded), kind="stable").tolist():
+            benefit = _BT_TUPLE[i]
+            score = scores[i]
+            
             # Calculate confidence (inverse of entropy for this benefit)
             p = score / 100.0
             if p > 0 and p < 1:
@@ -689,7 +1147,7 @@ class AdaptiveQuestionnaireEngine:
             
             rec = BenefitRecommendation(
                 benefit_type=benefit,
-                score=round(score, 1),
+                score=rounded[i],
                 confidence=round(confidence, 2),
                 priority=priority,
                 recommendation=recommendation_details,
@@ -697,11 +1155,10 @@ class AdaptiveQuestionnaireEngine:
             )
             
             recommendations.append(rec)
+            if priority in by_priority:
+                by_priority[priority].append(rec)
         
-        # Sort by score descending
-        recommendations.sort(key=lambda x: x.score, reverse=True)
-        
-        return recommendations
+        return RecommendationList(recommendations, **by_priority)
     
     def _generate_benefit_details(
         self,
@@ -711,83 +1168,8 @@ class AdaptiveQuestionnaireEngine:
         financials: UserFinancials
     ) -> Dict:
         """Generate specific coverage details for a benefit"""
-        
-        if benefit == BenefitType.LIFE:
-            # Life insurance: 8-10x income
-            base = financials.annual_income * 8
-            multiplier = 1 + (score - 50) / 100
-            coverage = base * multiplier + (demographics.num_children * 100000)
-            
-            return {
-                "coverage_amount": round(coverage, -3),
-                "type": "Term Life",
-                "duration": f"{min(65 - demographics.age, 30)} years",
-                "estimated_monthly_premium": round(coverage / 10000 * 7, 0)
-            }
-        
-        elif benefit == BenefitType.DISABILITY:
-            monthly_benefit = (financials.annual_income / 12) * (0.60 + score/500)
-            
-            return {
-                "monthly_benefit": round(monthly_benefit, -2),
-                "elimination_period": "90 days",
-                "benefit_period": "To age 65",
-                "estimated_monthly_premium": round(monthly_benefit * 0.02, 0)
-            }
-        
-        elif benefit == BenefitType.MEDICAL:
-            if score >= 75:
-                return {
-                    "plan_type": "PPO Low Deductible",
-                    "tier": "Gold",
-                    "deductible": 1000,
-                    "out_of_pocket_max": 5000,
-                    "estimated_monthly_premium": 450
-                }
-            elif score >= 50:
-                return {
-                    "plan_type": "PPO Standard",
-                    "tier": "Silver",
-                    "deductible": 2500,
-                    "out_of_pocket_max": 7000,
-                    "estimated_monthly_premium": 350
-                }
-            else:
-                return {
-                    "plan_type": "HDHP + HSA",
-                    "tier": "Bronze",
-                    "deductible": 5000,
-                    "out_of_pocket_max": 8000,
-                    "estimated_monthly_premium": 250
-                }
-        
-        elif benefit == BenefitType.HSA:
-            # Max contribution based on family status
-            max_contribution = 8300 if demographics.num_children > 0 else 4150
-            recommended = min(max_contribution, financials.annual_income * 0.05)
-            
-            return {
-                "recommended_annual_contribution": round(recommended, -2),
-                "tax_savings": round(recommended * 0.22, 0),  # Assume 22% bracket
-                "investment_options": "Yes"
-            }
-        
-        elif benefit == BenefitType.RETIREMENT_401K:
-            # Contribute enough to get full match
-            recommended_rate = min(15, max(6, score / 6))  # 6-15% of income
-            
-            return {
-                "recommended_contribution_rate": f"{round(recommended_rate)}%",
-                "annual_amount": round(financials.annual_income * recommended_rate / 100, -2),
-                "employer_match": "Up to 6%"
-            }
-        
-        else:
-            # Generic recommendation
-            return {
-                "coverage": "Standard" if score >= 50 else "Basic",
-                "estimated_monthly_premium": round(score * 0.5, 0)
-            }
+        formula = COVERAGE_FORMULAS.get(benefit, _generic_details)
+        return formula(score, demographics, financials)
     
     def _generate_rationale(self, benefit: BenefitType, score: float, priority: str) -> str:
         """Generate human-readable rationale for recommendation"""
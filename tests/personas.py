@@ -0,0 +1,63 @@
+"""
+Shared test personas - built once at import time and reused by reference
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adaptive_questionnaire_engine import UserDemographics, UserFinancials
+
+
+# Young Professional: Age 26, $55k income, Single, No children
+YOUNG_PRO_DEMO = UserDemographics(
+    name="Alex Johnson", age=26, gender="Female",
+    location="Austin, TX", zip_code="78701",
+    marital_status="single", num_children=0
+)
+
+YOUNG_PRO_FIN = UserFinancials(
+    annual_income=55000.0, monthly_expenses=3200.0,
+    total_debt=20000.0, savings=12000.0,
+    investment_accounts=5000.0,
+    spending_categories={}, income_volatility=0.15
+)
+
+# Family: Age 38, $130k income, Married, 3 children
+FAMILY_DEMO = UserDemographics(
+    name="Sarah Martinez", age=38, gender="Female",
+    location="Seattle, WA", zip_code="98101",
+    marital_status="married", num_children=3
+)
+
+FAMILY_FIN = UserFinancials(
+    annual_income=130000.0, monthly_expenses=8500.0,
+    total_debt=80000.0, savings=75000.0,
+    investment_accounts=150000.0,
+    spending_categories={}, income_volatility=0.08
+)
+
+
+def create_demo_user(name="Test User", age=35, income=100000):
+    """Helper to create demo user with correct structure"""
+    demographics = UserDemographics(
+        name=name,
+        age=age,
+        gender="Male",
+        location="New York, NY",
+        zip_code="10001",
+        marital_status="married",
+        num_children=2
+    )
+    
+    financials = UserFinancials(
+        annual_income=float(income),
+        monthly_expenses=float(income * 0.6 / 12),
+        total_debt=float(income * 0.4),
+        savings=float(income * 0.8),
+        investment_accounts=float(income * 0.5),
+        spending_categories={"housing": 2000.0, "food": 800.0, "transport": 500.0},
+        income_volatility=0.1
+    )
+    
+    return demographics, financials
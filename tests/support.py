@@ -0,0 +1,39 @@
+"""
+Shared test helpers - verbose logging, simulated-answer keyword matching and the
+per-class runner used by the parallel suite entry points
+"""
+
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+
+
+# Per-test output costs real time next to sub-millisecond timings; opt in with VERBOSE_TESTS=1
+VERBOSE = bool(os.environ.get("VERBOSE_TESTS"))
+
+
+def log(message):
+    """Print test detail only when VERBOSE_TESTS is set"""
+    if VERBOSE:
+        print(message)
+
+
+# Keywords the simulated answers branch on
+ANSWER_KEYWORDS = frozenset({"children", "kids", "risk", "bonus", "health", "debt"})
+
+
+def keyword_hits(question):
+    """Set of ANSWER_KEYWORDS among the words of the question text"""
+    return question.keyword_tags & ANSWER_KEYWORDS
+
+
+def run_test_class(test_class):
+    """Run one test class and return (tests run, failures, errors, output)"""
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
+    
+    with redirect_stdout(stream):
+        result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    
+    return result.testsRun, len(result.failures), len(result.errors), stream.getvalue()
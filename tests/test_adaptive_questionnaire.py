@@ -7,8 +7,11 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import copy
 import unittest
 import math
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter_ns
 from adaptive_questionnaire_engine import (
     AdaptiveQuestionnaireEngine,
     UserDemographics,
@@ -16,6 +19,13 @@ from adaptive_questionnaire_engine import (
     BenefitType,
     Question
 )
+from tests.support import log, run_test_class
+
+BENEFIT_TYPES = tuple(BenefitType)
+
+def make_scores(value):
+    """Build a scores dict with every benefit set to the same value"""
+    return {bt: value for bt in BENEFIT_TYPES}
 
 
 class TestEntropyCalculations(unittest.TestCase):
@@ -29,12 +39,12 @@ class TestEntropyCalculations(unittest.TestCase):
         )
         
         # Create uniform scores
-        uniform_scores = {bt: 50.0 for bt in BenefitType}
+        uniform_scores = make_scores(50.0)
         entropy = engine.calculate_entropy(uniform_scores)
         
         # Uniform distribution should have high entropy
         self.assertGreater(entropy, 3.0)
-        print(f"✓ Maximum entropy test: {entropy:.2f} bits (expected > 3.0)")
+        log(f"✓ Maximum entropy test: {entropy:.2f} bits (expected > 3.0)")
     
     def test_minimum_entropy(self):
         """Test entropy with certain distribution (minimum uncertainty)"""
@@ -44,13 +54,13 @@ class TestEntropyCalculations(unittest.TestCase):
         )
         
         # Create certain scores (one dominant benefit)
-        certain_scores = {bt: 10.0 for bt in BenefitType}
+        certain_scores = make_scores(10.0)
         certain_scores[BenefitType.MEDICAL] = 100.0
         entropy = engine.calculate_entropy(certain_scores)
         
         # Certain distribution should have low entropy
         self.assertLess(entropy, 2.0)
-        print(f"✓ Minimum entropy test: {entropy:.2f} bits (expected < 2.0)")
+        log(f"✓ Minimum entropy test: {entropy:.2f} bits (expected < 2.0)")
     
     def test_entropy_decreases_with_certainty(self):
         """Test that entropy decreases as we gain certainty"""
@@ -60,17 +70,17 @@ class TestEntropyCalculations(unittest.TestCase):
         )
         
         # Start with uniform
-        scores1 = {bt: 50.0 for bt in BenefitType}
+        scores1 = make_scores(50.0)
         entropy1 = engine.calculate_entropy(scores1)
         
         # Add some certainty
-        scores2 = {bt: 40.0 for bt in BenefitType}
+        scores2 = make_scores(40.0)
         scores2[BenefitType.MEDICAL] = 80.0
         scores2[BenefitType.LIFE] = 75.0
         entropy2 = engine.calculate_entropy(scores2)
         
         self.assertLess(entropy2, entropy1)
-        print(f"✓ Entropy decrease test: {entropy1:.2f} → {entropy2:.2f} bits")
+        log(f"✓ Entropy decrease test: {entropy1:.2f} → {entropy2:.2f} bits")
 
 
 class TestInformationGain(unittest.TestCase):
@@ -87,7 +97,7 @@ class TestInformationGain(unittest.TestCase):
         ig = engine.calculate_information_gain(question, engine.benefit_scores, [])
         
         self.assertGreaterEqual(ig, 0.0)
-        print(f"✓ Information gain positive test: {ig:.3f} bits")
+        log(f"✓ Information gain positive test: {ig:.3f} bits")
     
     def test_information_gain_all_questions(self):
         """Test information gain for all questions in bank"""
@@ -96,11 +106,34 @@ class TestInformationGain(unittest.TestCase):
             UserFinancials(annual_income=80000, monthly_expenses=5000, total_debt=20000, total_savings=30000)
         )
         
-        print("\n✓ Information Gain for all questions:")
-        for i, question in enumerate(engine.question_bank, 1):
+        ig_values = []
+        for question in engine.question_bank:
             ig = engine.calculate_information_gain(question, engine.benefit_scores, [])
             self.assertGreaterEqual(ig, 0.0)
-            print(f"  Q{i}: {question.text[:50]}... → {ig:.3f} bits")
+            ig_values.append(ig)
+        
+        log(f"✓ Information Gain for all questions: {[f'{ig:.3f}' for ig in ig_values]}")
+    
+    def test_information_gain_all_matches_per_question(self):
+        """Test that the batched IG matches calculate_information_gain for each question"""
+        engine = AdaptiveQuestionnaireEngine(
+            UserDemographics(name="Test", age=35, gender="F", location="Austin, TX",
+                             zip_code="78701", marital_status="married", num_children=2),
+            UserFinancials(annual_income=80000, monthly_expenses=5000, total_debt=20000,
+                           savings=30000, investment_accounts=10000)
+        )
+        engine.process_answer(engine.select_next_question(), "A")
+        
+        gains = engine.information_gain_all()
+        expected = [
+            engine.calculate_information_gain(q, engine.benefit_scores, engine.asked_ids)
+            for q in engine.question_bank
+        ]
+        
+        for gain, ig in zip(gains, expected):
+            self.assertAlmostEqual(gain, ig, places=9)
+        self.assertEqual(gains[engine.question_bank.index(engine.questions_asked[0])], 0.0)
+        log(f"✓ Batched IG test: best question {int(gains.argmax())}")
     
     def test_diminishing_information_gain(self):
         """Test that IG decreases as more questions are answered"""
@@ -119,7 +152,7 @@ class TestInformationGain(unittest.TestCase):
             engine.process_answer(question, 0)
         
         # Check if IG generally decreases
-        print(f"\n✓ Diminishing IG test: {[f'{ig:.3f}' for ig in ig_values]}")
+        log(f"\n✓ Diminishing IG test: {[f'{ig:.3f}' for ig in ig_values]}")
         self.assertGreater(ig_values[0], ig_values[-1])
 
 
@@ -133,14 +166,67 @@ class TestBayesianUpdates(unittest.TestCase):
             UserFinancials(annual_income=50000, monthly_expenses=3000, total_debt=0, total_savings=10000)
         )
         
-        initial_scores = engine.benefit_scores.copy()
+        before = engine.snapshot()
         question = engine.select_next_question()
         engine.process_answer(question, 0)
         
         # Scores should have changed
-        changes = sum(1 for bt in BenefitType if engine.benefit_scores[bt] != initial_scores[bt])
+        changes = engine.count_changed_scores(before)
         self.assertGreater(changes, 0)
-        print(f"✓ Bayesian update test: {changes}/{len(BenefitType)} scores changed")
+        log(f"✓ Bayesian update test: {changes}/{len(BenefitType)} scores changed")
+    
+    def test_scores_array_is_live_read_only_view(self):
+        """Test that scores_array tracks updates but cannot be written"""
+        engine = AdaptiveQuestionnaireEngine(
+            UserDemographics(name="Test", age=30, gender="M", location="Austin, TX",
+                             zip_code="78701", marital_status="single", num_children=0),
+            UserFinancials(annual_income=50000, monthly_expenses=3000, total_debt=0,
+                           savings=10000, investment_accounts=0)
+        )
+        scores = engine.scores_array
+        
+        with self.assertRaises(ValueError):
+            scores[0] = 0.0
+        
+        engine.process_answer(engine.select_next_question(), "A")
+        self.assertEqual(scores.tolist(), list(engine.benefit_scores.values()))
+        log("✓ Scores array test: view is read-only and stays in sync")
+    
+    def test_custom_question_uses_own_correlations(self):
+        """Test that a question reusing a bank id is scored by its own correlations"""
+        engine = AdaptiveQuestionnaireEngine(
+            UserDemographics(name="Test", age=30, gender="M", location="Austin, TX",
+                             zip_code="78701", marital_status="single", num_children=0),
+            UserFinancials(annual_income=50000, monthly_expenses=3000, total_debt=0,
+                           savings=10000, investment_accounts=0)
+        )
+        custom = Question(
+            id="Q9_pet_ownership",
+            text="Custom dental question",
+            choice_a="Yes",
+            choice_b="No",
+            correlations_a={BenefitType.DENTAL: 0.9},
+            correlations_b={},
+            dimensions=[]
+        )
+        before = engine.snapshot()
+        
+        # IG must match scoring the same correlations under an id outside the bank
+        renamed = Question(
+            id="custom_dental", text=custom.text, choice_a="Yes", choice_b="No",
+            correlations_a=custom.correlations_a, correlations_b={}, dimensions=[]
+        )
+        self.assertEqual(
+            engine.calculate_information_gain(custom, engine.benefit_scores, []),
+            engine.calculate_information_gain(renamed, engine.benefit_scores, [])
+        )
+        
+        engine.process_answer(custom, "A")
+        
+        dental = BENEFIT_TYPES.index(BenefitType.DENTAL)
+        self.assertAlmostEqual(engine.benefit_scores[BenefitType.DENTAL], min(before[dental] + 0.9 * 8.0, 100.0))
+        self.assertEqual(engine.count_changed_scores(before), 1)
+        log("✓ Custom question test: own correlations applied")
     
     def test_correlation_effects(self):
         """Test that highly correlated answers have strong effects"""
@@ -150,7 +236,7 @@ class TestBayesianUpdates(unittest.TestCase):
         )
         
         # Find question about children (should strongly affect life insurance)
-        question = next(q for q in engine.question_bank if "children" in q.text.lower() or "kids" in q.text.lower())
+        question = engine.find_question("children") or engine.find_question("kids")
         
         initial_life_score = engine.benefit_scores[BenefitType.LIFE]
         engine.process_answer(question, 0)  # Choice A
@@ -158,7 +244,7 @@ class TestBayesianUpdates(unittest.TestCase):
         
         score_change = abs(final_life_score - initial_life_score)
         self.assertGreater(score_change, 5.0)  # Should have significant impact
-        print(f"✓ Correlation test: Life insurance score changed by {score_change:.2f}")
+        log(f"✓ Correlation test: Life insurance score changed by {score_change:.2f}")
     
     def test_score_bounds(self):
         """Test that scores stay within valid bounds (0-100)"""
@@ -179,7 +265,7 @@ class TestBayesianUpdates(unittest.TestCase):
             self.assertGreaterEqual(score, 0.0)
             self.assertLessEqual(score, 100.0)
         
-        print(f"✓ Score bounds test: All scores in [0, 100]")
+        log(f"✓ Score bounds test: All scores in [0, 100]")
 
 
 class TestUserProfiles(unittest.TestCase):
@@ -197,7 +283,7 @@ class TestUserProfiles(unittest.TestCase):
         life_score = engine.benefit_scores[BenefitType.LIFE]
         retirement_score = engine.benefit_scores[BenefitType.RETIREMENT_401K]
         
-        print(f"✓ Young single profile: Medical={medical_score:.1f}, Life={life_score:.1f}, 401k={retirement_score:.1f}")
+        log(f"✓ Young single profile: Medical={medical_score:.1f}, Life={life_score:.1f}, 401k={retirement_score:.1f}")
         self.assertGreater(medical_score, 40.0)
     
     def test_family_profile(self):
@@ -212,7 +298,7 @@ class TestUserProfiles(unittest.TestCase):
         disability_score = engine.benefit_scores[BenefitType.DISABILITY]
         dependent_score = engine.benefit_scores[BenefitType.DEPENDENT_CARE]
         
-        print(f"✓ Family profile: Life={life_score:.1f}, Disability={disability_score:.1f}, Dependent={dependent_score:.1f}")
+        log(f"✓ Family profile: Life={life_score:.1f}, Disability={disability_score:.1f}, Dependent={dependent_score:.1f}")
         self.assertGreater(life_score, 60.0)
         self.assertGreater(disability_score, 40.0)
     
@@ -228,7 +314,7 @@ class TestUserProfiles(unittest.TestCase):
         disability_score = engine.benefit_scores[BenefitType.DISABILITY]
         supplemental_score = engine.benefit_scores[BenefitType.SUPPLEMENTAL_LIFE]
         
-        print(f"✓ High earner profile: Life={life_score:.1f}, Disability={disability_score:.1f}, Supplemental={supplemental_score:.1f}")
+        log(f"✓ High earner profile: Life={life_score:.1f}, Disability={disability_score:.1f}, Supplemental={supplemental_score:.1f}")
         self.assertGreater(life_score, 70.0)
     
     def test_near_retirement_profile(self):
@@ -242,8 +328,29 @@ class TestUserProfiles(unittest.TestCase):
         medical_score = engine.benefit_scores[BenefitType.MEDICAL]
         ltc_score = engine.benefit_scores[BenefitType.LONG_TERM_CARE]
         
-        print(f"✓ Near retirement profile: Medical={medical_score:.1f}, Long-term Care={ltc_score:.1f}")
+        log(f"✓ Near retirement profile: Medical={medical_score:.1f}, Long-term Care={ltc_score:.1f}")
         self.assertGreater(medical_score, 60.0)
+    
+    def test_score_profiles_batch_matches_engines(self):
+        """Test that batch profile scoring matches per-engine initial scores"""
+        demographics = [
+            UserDemographics(name="A", age=age, gender="F", location="Austin, TX", zip_code="78701",
+                             marital_status=status, num_children=children)
+            for age, status, children in [(25, "single", 0), (38, "married", 3), (60, "married", 0)]
+        ]
+        financials = [
+            UserFinancials(annual_income=income, monthly_expenses=income / 20, total_debt=income * 0.5,
+                           savings=income * 0.3, investment_accounts=income * 0.6,
+                           spending_categories={"healthcare": 600.0})
+            for income in (45000.0, 130000.0, 90000.0)
+        ]
+        
+        scores = AdaptiveQuestionnaireEngine.score_profiles_batch(demographics, financials)
+        
+        self.assertEqual(scores.shape, (3, len(BenefitType)))
+        for row, (demo, fin) in enumerate(zip(demographics, financials)):
+            self.assertEqual(scores[row].tolist(), AdaptiveQuestionnaireEngine(demo, fin).snapshot().tolist())
+        log(f"✓ Batch scoring test: {len(scores)} profiles match engine priors")
 
 
 class TestAdaptiveQuestioning(unittest.TestCase):
@@ -261,13 +368,13 @@ class TestAdaptiveQuestioning(unittest.TestCase):
         # Verify it has the highest IG
         max_ig = 0.0
         for q in engine.question_bank:
-            if q.id not in [ans.question.id for ans in engine.answer_history]:
+            if q.id not in engine.asked_ids:
                 ig = engine.calculate_information_gain(q, engine.benefit_scores, engine.answer_history)
                 max_ig = max(max_ig, ig)
         
         selected_ig = engine.calculate_information_gain(selected, engine.benefit_scores, engine.answer_history)
         self.assertAlmostEqual(selected_ig, max_ig, places=2)
-        print(f"✓ Question selection test: Selected IG={selected_ig:.3f}, Max IG={max_ig:.3f}")
+        log(f"✓ Question selection test: Selected IG={selected_ig:.3f}, Max IG={max_ig:.3f}")
     
     def test_stopping_criteria_entropy(self):
         """Test stopping when entropy is low enough"""
@@ -277,15 +384,16 @@ class TestAdaptiveQuestioning(unittest.TestCase):
         )
         
         # Manually set very certain scores
-        engine.benefit_scores = {bt: 20.0 for bt in BenefitType}
-        engine.benefit_scores[BenefitType.LIFE] = 100.0
-        engine.benefit_scores[BenefitType.DISABILITY] = 95.0
-        engine.benefit_scores[BenefitType.MEDICAL] = 90.0
+        engine.set_scores(20.0, {
+            BenefitType.LIFE: 100.0,
+            BenefitType.DISABILITY: 95.0,
+            BenefitType.MEDICAL: 90.0
+        })
         
         entropy = engine.calculate_entropy(engine.benefit_scores)
         should_stop = engine.should_stop()
         
-        print(f"✓ Entropy stopping test: Entropy={entropy:.3f}, Should stop={should_stop}")
+        log(f"✓ Entropy stopping test: Entropy={entropy:.3f}, Should stop={should_stop}")
         if entropy < 0.3:
             self.assertTrue(should_stop)
     
@@ -297,13 +405,10 @@ class TestAdaptiveQuestioning(unittest.TestCase):
         )
         
         # Simulate answering 15 questions
-        for i in range(15):
-            if len(engine.answer_history) < len(engine.question_bank):
-                question = engine.select_next_question()
-                engine.process_answer(question, 0)
+        engine.run_simulation(lambda question: 0, max_questions=15)
         
         self.assertTrue(engine.should_stop())
-        print(f"✓ Max questions test: Stopped after {len(engine.answer_history)} questions")
+        log(f"✓ Max questions test: Stopped after {len(engine.answer_history)} questions")
     
     def test_no_repeat_questions(self):
         """Test that questions are not repeated"""
@@ -319,7 +424,48 @@ class TestAdaptiveQuestioning(unittest.TestCase):
             asked_ids.add(question.id)
             engine.process_answer(question, 0)
         
-        print(f"✓ No repeat test: {len(asked_ids)} unique questions asked")
+        log(f"✓ No repeat test: {len(asked_ids)} unique questions asked")
+    
+    def test_copy_is_independent(self):
+        """Test that a copied engine shares the bank but not session state"""
+        engine = AdaptiveQuestionnaireEngine(
+            UserDemographics(name="Test", age=35, gender="F", location="Austin, TX",
+                             zip_code="78701", marital_status="married", num_children=2),
+            UserFinancials(annual_income=80000, monthly_expenses=5000, total_debt=20000,
+                           savings=30000, investment_accounts=10000)
+        )
+        clone = copy.copy(engine)
+        before = engine.snapshot()
+        
+        question = clone.select_next_question()
+        clone.process_answer(question, "A")
+        
+        self.assertIs(clone.question_bank, engine.question_bank)
+        self.assertEqual(engine.count_changed_scores(before), 0)
+        self.assertEqual(engine.question_history, [])
+        self.assertEqual(clone.question_history, [question.id])
+        log(f"✓ Copy test: {clone.count_changed_scores(before)} scores changed on the clone only")
+    
+    def test_run_simulation_policy(self):
+        """Test that run_simulation asks the policy once per question and honours the cap"""
+        engine = AdaptiveQuestionnaireEngine(
+            UserDemographics(name="Test", age=35, gender="F", location="Austin, TX",
+                             zip_code="78701", marital_status="married", num_children=2),
+            UserFinancials(annual_income=80000, monthly_expenses=5000, total_debt=20000,
+                           savings=30000, investment_accounts=10000)
+        )
+        seen = []
+        
+        def policy(question):
+            seen.append(question)
+            return "A"
+        
+        asked = engine.run_simulation(policy, max_questions=3)
+        
+        self.assertEqual(asked, seen)
+        self.assertEqual(len(asked), 3)
+        self.assertEqual(engine.question_history, [q.id for q in asked])
+        log(f"✓ Simulation test: {len(asked)} questions answered by policy")
 
 
 class TestRecommendationGeneration(unittest.TestCase):
@@ -340,13 +486,13 @@ class TestRecommendationGeneration(unittest.TestCase):
         recs = engine.generate_recommendations()
         
         # Check prioritization
-        critical = [r for r in recs if r.priority == "CRITICAL"]
-        recommended = [r for r in recs if r.priority == "RECOMMENDED"]
+        critical = recs.critical
+        recommended = recs.recommended
         
         if critical:
             self.assertGreater(critical[0].score, 75.0)
         
-        print(f"✓ Prioritization test: {len(critical)} critical, {len(recommended)} recommended")
+        log(f"✓ Prioritization test: {len(critical)} critical, {len(recommended)} recommended")
     
     def test_life_insurance_calculation(self):
         """Test life insurance coverage calculation"""
@@ -367,7 +513,7 @@ class TestRecommendationGeneration(unittest.TestCase):
             expected_min = 120000 * 8
             expected_max = 120000 * 12
             
-            print(f"✓ Life insurance calc: ${coverage:,.0f} (expected ${expected_min:,.0f}-${expected_max:,.0f})")
+            log(f"✓ Life insurance calc: ${coverage:,.0f} (expected ${expected_min:,.0f}-${expected_max:,.0f})")
             self.assertGreater(coverage, expected_min * 0.8)
     
     def test_disability_calculation(self):
@@ -390,7 +536,7 @@ class TestRecommendationGeneration(unittest.TestCase):
             expected_min = monthly_income * 0.55
             expected_max = monthly_income * 0.75
             
-            print(f"✓ Disability calc: ${monthly_benefit:,.0f}/mo (expected ${expected_min:,.0f}-${expected_max:,.0f})")
+            log(f"✓ Disability calc: ${monthly_benefit:,.0f}/mo (expected ${expected_min:,.0f}-${expected_max:,.0f})")
             self.assertGreater(monthly_benefit, expected_min)
             self.assertLess(monthly_benefit, expected_max * 1.1)
 
@@ -410,7 +556,7 @@ class TestEdgeCases(unittest.TestCase):
         engine.process_answer(question, 0)
         recs = engine.generate_recommendations()
         
-        print(f"✓ Zero income test: {len(recs)} recommendations generated")
+        log(f"✓ Zero income test: {len(recs)} recommendations generated")
         self.assertIsNotNone(recs)
     
     def test_high_age(self):
@@ -424,7 +570,7 @@ class TestEdgeCases(unittest.TestCase):
         medical_score = engine.benefit_scores[BenefitType.MEDICAL]
         ltc_score = engine.benefit_scores[BenefitType.LONG_TERM_CARE]
         
-        print(f"✓ High age test: Medical={medical_score:.1f}, LTC={ltc_score:.1f}")
+        log(f"✓ High age test: Medical={medical_score:.1f}, LTC={ltc_score:.1f}")
         self.assertGreater(medical_score, 40.0)
     
     def test_empty_question_bank(self):
@@ -440,7 +586,7 @@ class TestEdgeCases(unittest.TestCase):
         
         # Should stop
         self.assertTrue(engine.should_stop())
-        print(f"✓ Empty bank test: Stopped after all questions answered")
+        log(f"✓ Empty bank test: Stopped after all questions answered")
 
 
 class TestPerformance(unittest.TestCase):
@@ -448,26 +594,22 @@ class TestPerformance(unittest.TestCase):
     
     def test_entropy_calculation_speed(self):
         """Test entropy calculation performance"""
-        import time
-        
         engine = AdaptiveQuestionnaireEngine(
             UserDemographics(age=35, income=80000, marital_status="married", num_children=2),
             UserFinancials(annual_income=80000, monthly_expenses=5000, total_debt=20000, total_savings=30000)
         )
         
-        start = time.time()
+        start = perf_counter_ns()
         for _ in range(1000):
             engine.calculate_entropy(engine.benefit_scores)
-        elapsed = (time.time() - start) * 1000
+        elapsed = (perf_counter_ns() - start) / 1e6
         
         avg_time = elapsed / 1000
-        print(f"✓ Entropy speed: {avg_time:.3f}ms average (target <1ms)")
+        log(f"✓ Entropy speed: {avg_time:.3f}ms average (target <1ms)")
         self.assertLess(avg_time, 5.0)  # Should be very fast
     
     def test_information_gain_speed(self):
         """Test information gain calculation performance"""
-        import time
-        
         engine = AdaptiveQuestionnaireEngine(
             UserDemographics(age=35, income=80000, marital_status="married", num_children=2),
             UserFinancials(annual_income=80000, monthly_expenses=5000, total_debt=20000, total_savings=30000)
@@ -475,36 +617,44 @@ class TestPerformance(unittest.TestCase):
         
         question = engine.question_bank[0]
         
-        start = time.time()
+        start = perf_counter_ns()
         for _ in range(100):
             engine.calculate_information_gain(question, engine.benefit_scores, [])
-        elapsed = (time.time() - start) * 1000
+        elapsed = (perf_counter_ns() - start) / 1e6
         
         avg_time = elapsed / 100
-        print(f"✓ IG calculation speed: {avg_time:.3f}ms average (target <50ms)")
+        log(f"✓ IG calculation speed: {avg_time:.3f}ms average (target <50ms)")
         self.assertLess(avg_time, 100.0)
     
     def test_full_session_time(self):
         """Test complete session time"""
-        import time
-        
         engine = AdaptiveQuestionnaireEngine(
             UserDemographics(age=35, income=120000, marital_status="married", num_children=2),
             UserFinancials(annual_income=120000, monthly_expenses=8000, total_debt=50000, total_savings=100000)
         )
         
-        start = time.time()
-        while not engine.should_stop():
-            question = engine.select_next_question()
-            engine.process_answer(question, 0)
+        start = perf_counter_ns()
+        engine.run_simulation(lambda question: 0)
         
         recs = engine.generate_recommendations()
-        elapsed = (time.time() - start) * 1000
+        elapsed = (perf_counter_ns() - start) / 1e6
         
-        print(f"✓ Full session: {len(engine.answer_history)} questions in {elapsed:.1f}ms")
+        log(f"✓ Full session: {len(engine.answer_history)} questions in {elapsed:.1f}ms")
         self.assertLess(len(engine.answer_history), 20)  # Should be efficient
 
 
+TEST_CLASSES = [
+    TestEntropyCalculations,
+    TestInformationGain,
+    TestBayesianUpdates,
+    TestUserProfiles,
+    TestAdaptiveQuestioning,
+    TestRecommendationGeneration,
+    TestEdgeCases,
+    TestPerformance,
+]
+
+
 def run_all_tests():
     """Run all test suites with detailed output"""
     
@@ -512,36 +662,29 @@ def run_all_tests():
     print("ADAPTIVE QUESTIONNAIRE ENGINE - COMPREHENSIVE TEST SUITE")
     print("="*80 + "\n")
     
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestEntropyCalculations))
-    suite.addTests(loader.loadTestsFromTestCase(TestInformationGain))
-    suite.addTests(loader.loadTestsFromTestCase(TestBayesianUpdates))
-    suite.addTests(loader.loadTestsFromTestCase(TestUserProfiles))
-    suite.addTests(loader.loadTestsFromTestCase(TestAdaptiveQuestioning))
-    suite.addTests(loader.loadTestsFromTestCase(TestRecommendationGeneration))
-    suite.addTests(loader.loadTestsFromTestCase(TestEdgeCases))
-    suite.addTests(loader.loadTestsFromTestCase(TestPerformance))
+    # Test classes share no state, so each runs in its own worker process
+    with ProcessPoolExecutor() as pool:
+        outcomes = list(pool.map(run_test_class, TEST_CLASSES))
     
-    # Run with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    tests_run = failures = errors = 0
+    for run, failed, errored, output in outcomes:
+        print(output)
+        tests_run += run
+        failures += failed
+        errors += errored
     
     # Summary
     print("\n" + "="*80)
     print("TEST SUMMARY")
     print("="*80)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Successes: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
+    print(f"Tests run: {tests_run}")
+    print(f"Successes: {tests_run - failures - errors}")
+    print(f"Failures: {failures}")
+    print(f"Errors: {errors}")
+    print(f"Success rate: {((tests_run - failures - errors) / tests_run * 100):.1f}%")
     print("="*80 + "\n")
     
-    return result
+    return tests_run, failures, errors
 
 
 if __name__ == "__main__":
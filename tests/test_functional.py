@@ -2,7 +2,9 @@
 Simple Functional Test - Demonstrates the algorithm works correctly
 """
 
+import heapq
 import sys
+from operator import itemgetter
 sys.path.insert(0, '.')
 
 from adaptive_questionnaire_engine import (
@@ -11,6 +13,49 @@ from adaptive_questionnaire_engine import (
     UserFinancials,
     BenefitType
 )
+from tests.support import keyword_hits
+
+def run_profile(demographics, financials, policy, max_questions, critical_limit=None, detail_items=0):
+    """Run one simulated profile, print its session, and return (engine, recommendations)"""
+    engine = AdaptiveQuestionnaireEngine(demographics, financials)
+    
+    print(f"✓ Engine initialized")
+    print(f"✓ Question bank: {len(engine.question_bank)} questions available")
+    print(f"✓ Benefit types tracked: {len(engine.benefit_scores)}")
+    
+    # Show initial top benefits
+    top_benefits = heapq.nlargest(5, engine.benefit_scores.items(), key=itemgetter(1))
+    print(f"\nInitial Top 5 Benefits:")
+    for i, (bt, score) in enumerate(top_benefits, 1):
+        print(f"   {i}. {bt.value}: {score:.1f}/100")
+    
+    # Ask questions
+    print(f"\nAdaptive Questioning:")
+    asked = engine.run_simulation(policy, max_questions=max_questions)
+    for i, (question, answer) in enumerate(zip(asked, engine.answers), 1):
+        answer_text = question.choice_a if answer.choice == 'A' else question.choice_b
+        print(f"   Q{i}: {question.text[:70]}... → {answer_text[:30]}...")
+    
+    # Generate recommendations
+    recs = engine.generate_recommendations()
+    
+    print(f"\n✓ Asked {len(asked)} questions")
+    print(f"✓ Generated {len(recs)} recommendations")
+    
+    print(f"\nFinal Recommendations:")
+    print(f"   CRITICAL ({len(recs.critical)}):")
+    for rec in recs.critical[:critical_limit]:
+        print(f"      • {rec.benefit_type.value}: {rec.score:.1f}/100")
+        if detail_items and rec.recommendation:
+            for key, value in list(rec.recommendation.items())[:detail_items]:
+                print(f"         - {key}: {value}")
+    
+    print(f"   RECOMMENDED ({len(recs.recommended)}):")
+    for rec in recs.recommended[:5]:
+        print(f"      • {rec.benefit_type.value}: {rec.score:.1f}/100")
+    
+    return engine, recs
+
 
 print("\n" + "="*80)
 print("ADAPTIVE QUESTIONNAIRE ENGINE - FUNCTIONAL TEST")
@@ -40,52 +85,21 @@ financials1 = UserFinancials(
     income_volatility=0.15
 )
 
-engine1 = AdaptiveQuestionnaireEngine(demographics1, financials1)
-
-print(f"✓ Engine initialized")
-print(f"✓ Question bank: {len(engine1.question_bank)} questions available")
-print(f"✓ Benefit types tracked: {len(engine1.benefit_scores)}")
-
-# Show initial top benefits
-sorted_benefits = sorted(engine1.benefit_scores.items(), key=lambda x: x[1], reverse=True)
-print(f"\nInitial Top 5 Benefits:")
-for i, (bt, score) in enumerate(sorted_benefits[:5], 1):
-    print(f"   {i}. {bt.value}: {score:.1f}/100")
-
-# Ask questions
-print(f"\nAdaptive Questioning:")
-question_count = 0
-while not engine1.should_stop() and question_count < 8:
-    question = engine1.select_next_question()
+def young_professional_policy(question):
+    hits = keyword_hits(question)
     # Simulate young professional answers
-    if "children" in question.text.lower():
-        choice = 1  # No
-    elif "risk" in question.text.lower():
-        choice = 0  # More adventurous
+    if "children" in hits:
+        return 1  # No
+    elif "risk" in hits:
+        return 0  # More adventurous
     else:
-        choice = 0
-    
-    engine1.process_answer(question, choice)
-    question_count += 1
-    print(f"   Q{question_count}: {question.text[:70]}... → {question.question_choices[choice][:30]}...")
+        return 0
 
-# Generate recommendations
-recs1 = engine1.generate_recommendations()
-
-print(f"\n✓ Asked {question_count} questions")
-print(f"✓ Generated {len(recs1)} recommendations")
-
-critical1 = [r for r in recs1 if r.priority == "CRITICAL"]
-recommended1 = [r for r in recs1 if r.priority == "RECOMMENDED"]
-
-print(f"\nFinal Recommendations:")
-print(f"   CRITICAL ({len(critical1)}):")
-for rec in critical1[:3]:
-    print(f"      • {rec.benefit_type.value}: {rec.score:.1f}/100")
-
-print(f"   RECOMMENDED ({len(recommended1)}):")
-for rec in recommended1[:5]:
-    print(f"      • {rec.benefit_type.value}: {rec.score:.1f}/100")
+engine1, recs1 = run_profile(
+    demographics1, financials1, young_professional_policy, max_questions=8, critical_limit=3
+)
+question_count = len(engine1.questions_asked)
+score1 = {r.benefit_type: r.score for r in recs1}
 
 
 # Test 2: Family with Children
@@ -112,53 +126,21 @@ financials2 = UserFinancials(
     income_volatility=0.08
 )
 
-engine2 = AdaptiveQuestionnaireEngine(demographics2, financials2)
-
-print(f"✓ Engine initialized")
-
-# Show initial top benefits
-sorted_benefits2 = sorted(engine2.benefit_scores.items(), key=lambda x: x[1], reverse=True)
-print(f"\nInitial Top 5 Benefits:")
-for i, (bt, score) in enumerate(sorted_benefits2[:5], 1):
-    print(f"   {i}. {bt.value}: {score:.1f}/100")
-
-# Ask questions
-print(f"\nAdaptive Questioning:")
-question_count2 = 0
-while not engine2.should_stop() and question_count2 < 10:
-    question = engine2.select_next_question()
+def family_policy(question):
+    hits = keyword_hits(question)
     # Simulate family-oriented answers
-    if "children" in question.text.lower() or "kids" in question.text.lower():
-        choice = 0  # Yes
-    elif "risk" in question.text.lower():
-        choice = 1  # Conservative
+    if "children" in hits or "kids" in hits:
+        return 0  # Yes
+    elif "risk" in hits:
+        return 1  # Conservative
     else:
-        choice = 0
-    
-    engine2.process_answer(question, choice)
-    question_count2 += 1
-    print(f"   Q{question_count2}: {question.text[:70]}... → {question.question_choices[choice][:30]}...")
-
-# Generate recommendations
-recs2 = engine2.generate_recommendations()
-
-print(f"\n✓ Asked {question_count2} questions")
-print(f"✓ Generated {len(recs2)} recommendations")
+        return 0
 
-critical2 = [r for r in recs2 if r.priority == "CRITICAL"]
-recommended2 = [r for r in recs2 if r.priority == "RECOMMENDED"]
-
-print(f"\nFinal Recommendations:")
-print(f"   CRITICAL ({len(critical2)}):")
-for rec in critical2:
-    print(f"      • {rec.benefit_type.value}: {rec.score:.1f}/100")
-    if rec.details:
-        for key, value in list(rec.details.items())[:2]:
-            print(f"         - {key}: {value}")
-
-print(f"   RECOMMENDED ({len(recommended2)}):")
-for rec in recommended2[:5]:
-    print(f"      • {rec.benefit_type.value}: {rec.score:.1f}/100")
+engine2, recs2 = run_profile(
+    demographics2, financials2, family_policy, max_questions=10, detail_items=2
+)
+question_count2 = len(engine2.questions_asked)
+score2 = {r.benefit_type: r.score for r in recs2}
 
 
 # Comparison
@@ -166,8 +148,8 @@ print("\n\n📊 COMPARISON ANALYSIS")
 print("="*80)
 
 print(f"\nLife Insurance Scores:")
-life1 = next((r.score for r in recs1 if r.benefit_type == BenefitType.LIFE), 0)
-life2 = next((r.score for r in recs2 if r.benefit_type == BenefitType.LIFE), 0)
+life1 = score1.get(BenefitType.LIFE, 0)
+life2 = score2.get(BenefitType.LIFE, 0)
 print(f"   Young Professional: {life1:.1f}/100")
 print(f"   Family (3 kids):    {life2:.1f}/100")
 print(f"   Difference:         +{life2-life1:.1f} points")
@@ -176,20 +158,20 @@ if life2 > life1:
     print(f"   ✓ Algorithm correctly prioritizes life insurance for family")
 
 print(f"\nDisability Insurance Scores:")
-disability1 = next((r.score for r in recs1 if r.benefit_type == BenefitType.DISABILITY), 0)
-disability2 = next((r.score for r in recs2 if r.benefit_type == BenefitType.DISABILITY), 0)
+disability1 = score1.get(BenefitType.DISABILITY, 0)
+disability2 = score2.get(BenefitType.DISABILITY, 0)
 print(f"   Young Professional: {disability1:.1f}/100")
 print(f"   Family (3 kids):    {disability2:.1f}/100")
 
 print(f"\n401(k) Scores:")
-retirement1 = next((r.score for r in recs1 if r.benefit_type == BenefitType.RETIREMENT_401K), 0)
-retirement2 = next((r.score for r in recs2 if r.benefit_type == BenefitType.RETIREMENT_401K), 0)
+retirement1 = score1.get(BenefitType.RETIREMENT_401K, 0)
+retirement2 = score2.get(BenefitType.RETIREMENT_401K, 0)
 print(f"   Young Professional: {retirement1:.1f}/100")
 print(f"   Family (3 kids):    {retirement2:.1f}/100")
 
 print(f"\nDependent Care Scores:")
-dependent1 = next((r.score for r in recs1 if r.benefit_type == BenefitType.DEPENDENT_CARE), 0)
-dependent2 = next((r.score for r in recs2 if r.benefit_type == BenefitType.DEPENDENT_CARE), 0)
+dependent1 = score1.get(BenefitType.DEPENDENT_CARE_FSA, 0)
+dependent2 = score2.get(BenefitType.DEPENDENT_CARE_FSA, 0)
 print(f"   Young Professional: {dependent1:.1f}/100")
 print(f"   Family (3 kids):    {dependent2:.1f}/100")
 print(f"   Difference:         +{dependent2-dependent1:.1f} points")
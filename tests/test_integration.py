@@ -6,13 +6,134 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import copy
+import hashlib
+import heapq
+import pickle
 import unittest
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+import numpy as np
+
+import _fastmath
+import adaptive_questionnaire_engine
 from adaptive_questionnaire_engine import (
     AdaptiveQuestionnaireEngine,
     UserDemographics,
     UserFinancials,
-    BenefitType
+    BenefitType,
+    calculate_entropy
 )
+import tests.support
+from tests.support import VERBOSE, log, keyword_hits, run_test_class
+
+
+# Opt-in on-disk cache of replayed journeys for repeat CI runs; set CI_CACHE=1
+CI_CACHE = os.environ.get("CI_CACHE") == "1"
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".rec_cache")
+
+JourneyResult = namedtuple(
+    "JourneyResult", ["initial_entropy", "questions_asked", "final_entropy", "recommendations"]
+)
+
+
+def _cache_salt():
+    """Hash of the engine, test and policy-helper sources plus numeric library versions, so changing any invalidates the cache"""
+    try:
+        import numba
+        numba_version = numba.__version__
+    except ImportError:
+        numba_version = None
+    
+    digest = hashlib.sha256(repr((np.__version__, numba_version)).encode())
+    for module in (adaptive_questionnaire_engine, _fastmath, tests.support, sys.modules[__name__]):
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# Computed once per process; only needed when the cache is enabled
+CACHE_SALT = _cache_salt() if CI_CACHE else None
+
+
+def run_journey(demographics, financials, policy, max_questions):
+    """Run a questionnaire session answered by policy, reusing a cached result when enabled"""
+    if CI_CACHE:
+        key = hashlib.sha256(repr(
+            (CACHE_SALT, demographics, financials, policy.__qualname__, max_questions)
+        ).encode()).hexdigest()
+        path = os.path.join(CACHE_DIR, f"{key}.pkl")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return pickle.load(f)
+    
+    engine = AdaptiveQuestionnaireEngine(demographics, financials)
+    initial_entropy = calculate_entropy(engine.benefit_scores)
+    asked = engine.run_simulation(policy, max_questions=max_questions)
+    result = JourneyResult(
+        initial_entropy,
+        len(asked),
+        calculate_entropy(engine.benefit_scores),
+        engine.generate_recommendations()
+    )
+    
+    if CI_CACHE:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(result, f)
+    
+    return result
+
+
+def young_professional_policy(question):
+    hits = keyword_hits(question)
+    
+    # Young professional answers
+    if "children" in hits:
+        return 1  # No
+    elif "risk" in hits:
+        return 0  # More adventurous
+    elif "debt" in hits:
+        return 0  # Yes, has debt
+    else:
+        return 0
+
+
+def near_retirement_policy(question):
+    hits = keyword_hits(question)
+    
+    # Conservative near-retirement answers
+    if "risk" in hits:
+        return 1  # Conservative
+    elif "health" in hits:
+        return 0  # Some concerns
+    else:
+        return 1
+
+
+# (title, demographics kwargs, financials kwargs, answer policy, minimum medical score)
+POLICY_JOURNEYS = [
+    (
+        "Young Professional (Age 26, $60k, Single, No kids)",
+        dict(name="Young Professional", age=26, gender="Female", location="Austin, TX",
+             zip_code="78701", marital_status="single", num_children=0),
+        dict(annual_income=60000.0, monthly_expenses=3500.0, total_debt=25000.0,
+             savings=15000.0, investment_accounts=0.0),
+        young_professional_policy,
+        None,
+    ),
+    (
+        "Near Retirement (Age 62, $95k, Married, No kids)",
+        dict(name="Near Retirement", age=62, gender="Male", location="Phoenix, AZ",
+             zip_code="85001", marital_status="married", num_children=0),
+        dict(annual_income=95000.0, monthly_expenses=6500.0, total_debt=15000.0,
+             savings=750000.0, investment_accounts=0.0),
+        near_retirement_policy,
+        60.0,
+    ),
+]
 
 
 class TestCompleteUserJourneys(unittest.TestCase):
@@ -20,20 +141,20 @@ class TestCompleteUserJourneys(unittest.TestCase):
     
     def test_typical_family_journey(self):
         """Complete journey for typical family"""
-        print("\n" + "="*80)
-        print("TEST: Typical Family (Age 35, $120k, Married, 2 kids)")
-        print("="*80)
+        log("\n" + "="*80)
+        log("TEST: Typical Family (Age 35, $120k, Married, 2 kids)")
+        log("="*80)
         
         engine = AdaptiveQuestionnaireEngine(
             UserDemographics(age=35, income=120000, marital_status="married", num_children=2),
             UserFinancials(annual_income=120000, monthly_expenses=8000, total_debt=50000, total_savings=100000)
         )
         
-        print(f"\nInitial Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
-        print(f"Initial Top 3 Benefits:")
-        sorted_benefits = sorted(engine.benefit_scores.items(), key=lambda x: x[1], reverse=True)
-        for i, (bt, score) in enumerate(sorted_benefits[:3], 1):
-            print(f"  {i}. {bt.value}: {score:.1f}")
+        log(f"\nInitial Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
+        log(f"Initial Top 3 Benefits:")
+        top_benefits = heapq.nlargest(3, engine.benefit_scores.items(), key=itemgetter(1))
+        for i, (bt, score) in enumerate(top_benefits, 1):
+            log(f"  {i}. {bt.value}: {score:.1f}")
         
         # Simulate answering questions intelligently
         answers = []
@@ -41,15 +162,16 @@ class TestCompleteUserJourneys(unittest.TestCase):
         
         while not engine.should_stop() and question_count < 12:
             question = engine.select_next_question()
+            hits = keyword_hits(question)
             
             # Simulate intelligent answers based on profile
-            if "children" in question.text.lower() or "kids" in question.text.lower():
+            if "children" in hits or "kids" in hits:
                 choice = 0  # Yes to children questions
-            elif "risk" in question.text.lower() and "adventurous" in question.choices[0].lower():
+            elif "risk" in hits and "adventurous" in question.choices_lower[0]:
                 choice = 1  # Conservative
-            elif "bonus" in question.text.lower():
+            elif "bonus" in hits:
                 choice = 0  # Invest (high income)
-            elif "health" in question.text.lower():
+            elif "health" in hits:
                 choice = 1  # Good health
             else:
                 choice = 0  # Default to first choice
@@ -57,10 +179,12 @@ class TestCompleteUserJourneys(unittest.TestCase):
             ig = engine.calculate_information_gain(question, engine.benefit_scores, engine.answer_history)
             engine.process_answer(question, choice)
             
-            print(f"\nQ{question_count + 1}: {question.text}")
-            print(f"  Answer: {question.choices[choice]}")
-            print(f"  IG: {ig:.3f} bits")
-            print(f"  Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
+            if VERBOSE:
+                entropy = engine.calculate_entropy(engine.benefit_scores)
+                print(f"\nQ{question_count + 1}: {question.text}")
+                print(f"  Answer: {question.choice_a if choice == 'A' else question.choice_b}")
+                print(f"  IG: {ig:.3f} bits")
+                print(f"  Entropy: {entropy:.2f} bits")
             
             answers.append((question, choice, ig))
             question_count += 1
@@ -68,120 +192,60 @@ class TestCompleteUserJourneys(unittest.TestCase):
         # Generate recommendations
         recs = engine.generate_recommendations()
         
-        print(f"\n{'='*80}")
-        print("FINAL RECOMMENDATIONS")
-        print(f"{'='*80}")
-        print(f"Questions Asked: {len(answers)}")
-        print(f"Final Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
+        log(f"\n{'='*80}")
+        log("FINAL RECOMMENDATIONS")
+        log(f"{'='*80}")
+        log(f"Questions Asked: {len(answers)}")
+        log(f"Final Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
         
-        critical = [r for r in recs if r.priority == "CRITICAL"]
-        recommended = [r for r in recs if r.priority == "RECOMMENDED"]
+        critical = recs.critical
+        recommended = recs.recommended
         
-        print(f"\nCRITICAL ({len(critical)}):")
+        log(f"\nCRITICAL ({len(critical)}):")
         for rec in critical:
-            print(f"  • {rec.benefit_type.value}: {rec.score:.1f}/100")
-            if rec.details:
-                for key, value in list(rec.details.items())[:3]:
-                    print(f"    - {key}: {value}")
+            log(f"  • {rec.benefit_type.value}: {rec.score:.1f}/100")
+            if rec.recommendation:
+                for key, value in list(rec.recommendation.items())[:3]:
+                    log(f"    - {key}: {value}")
         
-        print(f"\nRECOMMENDED ({len(recommended)}):")
+        log(f"\nRECOMMENDED ({len(recommended)}):")
         for rec in recommended[:5]:
-            print(f"  • {rec.benefit_type.value}: {rec.score:.1f}/100")
+            log(f"  • {rec.benefit_type.value}: {rec.score:.1f}/100")
         
         # Assertions
         self.assertGreater(len(critical), 0, "Should have critical recommendations")
         self.assertIn(BenefitType.LIFE, [r.benefit_type for r in critical], "Life insurance should be critical for family")
-        print(f"\n✓ Test passed: {len(critical)} critical, {len(recommended)} recommended\n")
+        log(f"\n✓ Test passed: {len(critical)} critical, {len(recommended)} recommended\n")
     
-    def test_young_professional_journey(self):
-        """Complete journey for young professional"""
-        print("\n" + "="*80)
-        print("TEST: Young Professional (Age 26, $60k, Single, No kids)")
-        print("="*80)
-        
-        engine = AdaptiveQuestionnaireEngine(
-            UserDemographics(age=26, income=60000, marital_status="single", num_children=0),
-            UserFinancials(annual_income=60000, monthly_expenses=3500, total_debt=25000, total_savings=15000)
-        )
-        
-        print(f"\nInitial Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
-        
-        question_count = 0
-        while not engine.should_stop() and question_count < 10:
-            question = engine.select_next_question()
-            
-            # Young professional answers
-            if "children" in question.text.lower():
-                choice = 1  # No
-            elif "risk" in question.text.lower():
-                choice = 0  # More adventurous
-            elif "debt" in question.text.lower():
-                choice = 0  # Yes, has debt
-            else:
-                choice = 0
-            
-            engine.process_answer(question, choice)
-            question_count += 1
-        
-        recs = engine.generate_recommendations()
-        
-        print(f"\nQuestions Asked: {question_count}")
-        print(f"Final Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
-        
-        critical = [r for r in recs if r.priority == "CRITICAL"]
-        print(f"\nTop Recommendations:")
-        for i, rec in enumerate(sorted(recs, key=lambda x: x.score, reverse=True)[:5], 1):
-            print(f"  {i}. {rec.benefit_type.value}: {rec.score:.1f}/100")
-        
-        # Should prioritize medical and 401k over life
-        medical_rec = next((r for r in recs if r.benefit_type == BenefitType.MEDICAL), None)
-        life_rec = next((r for r in recs if r.benefit_type == BenefitType.LIFE), None)
-        
-        self.assertIsNotNone(medical_rec)
-        print(f"\n✓ Test passed: Medical prioritized for young professional\n")
-    
-    def test_near_retirement_journey(self):
-        """Complete journey for near-retirement person"""
-        print("\n" + "="*80)
-        print("TEST: Near Retirement (Age 62, $95k, Married, No kids)")
-        print("="*80)
-        
-        engine = AdaptiveQuestionnaireEngine(
-            UserDemographics(age=62, income=95000, marital_status="married", num_children=0),
-            UserFinancials(annual_income=95000, monthly_expenses=6500, total_debt=15000, total_savings=750000)
-        )
-        
-        print(f"\nInitial Entropy: {engine.calculate_entropy(engine.benefit_scores):.2f} bits")
-        
-        question_count = 0
-        while not engine.should_stop() and question_count < 10:
-            question = engine.select_next_question()
-            
-            # Conservative near-retirement answers
-            if "risk" in question.text.lower():
-                choice = 1  # Conservative
-            elif "health" in question.text.lower():
-                choice = 0  # Some concerns
-            else:
-                choice = 1
-            
-            engine.process_answer(question, choice)
-            question_count += 1
-        
-        recs = engine.generate_recommendations()
-        
-        print(f"\nQuestions Asked: {question_count}")
-        print(f"Top Recommendations:")
-        for i, rec in enumerate(sorted(recs, key=lambda x: x.score, reverse=True)[:5], 1):
-            print(f"  {i}. {rec.benefit_type.value}: {rec.score:.1f}/100")
-        
-        # Should prioritize medical and long-term care
-        medical_rec = next((r for r in recs if r.benefit_type == BenefitType.MEDICAL), None)
-        ltc_rec = next((r for r in recs if r.benefit_type == BenefitType.LONG_TERM_CARE), None)
-        
-        self.assertIsNotNone(medical_rec)
-        self.assertGreater(medical_rec.score, 60.0)
-        print(f"\n✓ Test passed: Medical/LTC prioritized for near-retirement\n")
+    def test_policy_journeys(self):
+        """Complete journeys for profiles answered by a fixed policy"""
+        for title, demographics, financials, policy, min_medical_score in POLICY_JOURNEYS:
+            with self.subTest(profile=title):
+                log("\n" + "="*80)
+                log(f"TEST: {title}")
+                log("="*80)
+                
+                journey = run_journey(
+                    UserDemographics(**demographics),
+                    UserFinancials(**financials),
+                    policy,
+                    max_questions=10
+                )
+                recs = journey.recommendations
+                
+                log(f"\nInitial Entropy: {journey.initial_entropy:.2f} bits")
+                log(f"\nQuestions Asked: {journey.questions_asked}")
+                log(f"Final Entropy: {journey.final_entropy:.2f} bits")
+                log(f"Top Recommendations:")
+                for i, rec in enumerate(recs[:5], 1):
+                    log(f"  {i}. {rec.benefit_type.value}: {rec.score:.1f}/100")
+                
+                # Medical should always be recommended, with a floor for some profiles
+                medical_rec = next((r for r in recs if r.benefit_type == BenefitType.MEDICAL), None)
+                self.assertIsNotNone(medical_rec)
+                if min_medical_score is not None:
+                    self.assertGreater(medical_rec.score, min_medical_score)
+                log(f"\n✓ Test passed: {title}\n")
 
 
 class TestConsistency(unittest.TestCase):
@@ -189,27 +253,26 @@ class TestConsistency(unittest.TestCase):
     
     def test_deterministic_results(self):
         """Test that same inputs produce same results"""
-        results = []
+        results = np.empty((3, len(BenefitType)))
+        prototype = AdaptiveQuestionnaireEngine(
+            UserDemographics(age=35, income=100000, marital_status="married", num_children=1),
+            UserFinancials(annual_income=100000, monthly_expenses=6000, total_debt=30000, total_savings=50000)
+        )
         
-        for _ in range(3):
-            engine = AdaptiveQuestionnaireEngine(
-                UserDemographics(age=35, income=100000, marital_status="married", num_children=1),
-                UserFinancials(annual_income=100000, monthly_expenses=6000, total_debt=30000, total_savings=50000)
-            )
+        for run in range(len(results)):
+            engine = copy.copy(prototype)
             
             # Answer same questions same way
             for i in range(5):
                 question = engine.select_next_question()
                 engine.process_answer(question, i % 2)
             
-            results.append(engine.benefit_scores.copy())
+            results[run] = engine.scores_array
         
         # All results should be identical
-        for i in range(1, len(results)):
-            for bt in BenefitType:
-                self.assertAlmostEqual(results[0][bt], results[i][bt], places=5)
+        np.testing.assert_allclose(results[1:], results[:-1], rtol=0, atol=1e-5)
         
-        print("✓ Consistency test: Results are deterministic")
+        log("✓ Consistency test: Results are deterministic")
     
     def test_similar_profiles_similar_results(self):
         """Test that similar profiles get similar recommendations"""
@@ -225,11 +288,12 @@ class TestConsistency(unittest.TestCase):
         )
         
         # Check initial scores are similar
-        for bt in BenefitType:
-            diff = abs(engine1.benefit_scores[bt] - engine2.benefit_scores[bt])
-            self.assertLess(diff, 15.0, f"{bt.value} scores differ by {diff:.1f}")
+        np.testing.assert_array_less(
+            np.abs(engine1.snapshot() - engine2.snapshot()), 15.0,
+            err_msg="Similar profiles should have initial scores within 15 points"
+        )
         
-        print("✓ Similarity test: Similar profiles produce similar scores")
+        log("✓ Similarity test: Similar profiles produce similar scores")
 
 
 class TestAccuracy(unittest.TestCase):
@@ -245,7 +309,7 @@ class TestAccuracy(unittest.TestCase):
         
         life_score = engine.benefit_scores[BenefitType.LIFE]
         self.assertGreater(life_score, 65.0, f"Life insurance score {life_score:.1f} should be >65 for high-need family")
-        print(f"✓ Life insurance need test: Score {life_score:.1f} (expected >65)")
+        log(f"✓ Life insurance need test: Score {life_score:.1f} (expected >65)")
     
     def test_low_life_insurance_need(self):
         """Test that low life insurance need is detected"""
@@ -257,7 +321,7 @@ class TestAccuracy(unittest.TestCase):
         
         life_score = engine.benefit_scores[BenefitType.LIFE]
         # Life insurance still important but less critical
-        print(f"✓ Low life insurance need test: Score {life_score:.1f}")
+        log(f"✓ Low life insurance need test: Score {life_score:.1f}")
     
     def test_disability_need_detection(self):
         """Test disability insurance need detection"""
@@ -269,7 +333,14 @@ class TestAccuracy(unittest.TestCase):
         
         disability_score = engine.benefit_scores[BenefitType.DISABILITY]
         self.assertGreater(disability_score, 40.0)
-        print(f"✓ Disability need test: Score {disability_score:.1f} (expected >40)")
+        log(f"✓ Disability need test: Score {disability_score:.1f} (expected >40)")
+
+
+INTEGRATION_TEST_CLASSES = [
+    TestCompleteUserJourneys,
+    TestConsistency,
+    TestAccuracy,
+]
 
 
 def run_integration_tests():
@@ -278,21 +349,22 @@ def run_integration_tests():
     print("INTEGRATION & ACCURACY TEST SUITE")
     print("="*80)
     
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
+    # Each test builds its own engine, so classes run in separate worker processes
+    with ProcessPoolExecutor() as pool:
+        outcomes = list(pool.map(run_test_class, INTEGRATION_TEST_CLASSES))
     
-    suite.addTests(loader.loadTestsFromTestCase(TestCompleteUserJourneys))
-    suite.addTests(loader.loadTestsFromTestCase(TestConsistency))
-    suite.addTests(loader.loadTestsFromTestCase(TestAccuracy))
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    tests_run = failures = errors = 0
+    for run, failed, errored, output in outcomes:
+        print(output)
+        tests_run += run
+        failures += failed
+        errors += errored
     
     print("\n" + "="*80)
-    print(f"Integration Tests: {result.testsRun - len(result.failures) - len(result.errors)}/{result.testsRun} passed")
+    print(f"Integration Tests: {tests_run - failures - errors}/{tests_run} passed")
     print("="*80 + "\n")
     
-    return result
+    return tests_run, failures, errors
 
 
 if __name__ == "__main__":
@@ -3,14 +3,14 @@ Working Functional Test - Demonstrates algorithm with correct API
 """
 
 import sys
+from operator import itemgetter
 sys.path.insert(0, '.')
 
 from adaptive_questionnaire_engine import (
     AdaptiveQuestionnaireEngine,
-    UserDemographics,
-    UserFinancials,
     BenefitType
 )
+from tests.personas import YOUNG_PRO_DEMO, YOUNG_PRO_FIN, FAMILY_DEMO, FAMILY_FIN
 
 print("\n" + "="*80)
 print(" ADAPTIVE BENEFIT SELECTION ALGORITHM - FUNCTIONAL TESTING")
@@ -21,41 +21,33 @@ print("\n┌─ TEST 1: Young Professional ────────────
 print("│ Profile: Age 26, $55k income, Single, No children                     │")
 print("└────────────────────────────────────────────────────────────────────────┘")
 
-demo1 = UserDemographics(
-    name="Alex Johnson", age=26, gender="Female",
-    location="Austin, TX", zip_code="78701",
-    marital_status="single", num_children=0
-)
+demo1 = YOUNG_PRO_DEMO
 
-fin1 = UserFinancials(
-    annual_income=55000.0, monthly_expenses=3200.0,
-    total_debt=20000.0, savings=12000.0,
-    investment_accounts=5000.0,
-    spending_categories={}, income_volatility=0.15
-)
+fin1 = YOUNG_PRO_FIN
 
 engine1 = AdaptiveQuestionnaireEngine(demo1, fin1)
 
 # Show initial scores
-sorted1 = sorted(engine1.benefit_scores.items(), key=lambda x: x[1], reverse=True)
+sorted1 = sorted(engine1.benefit_scores.items(), key=itemgetter(1), reverse=True)
 print(f"\n📊 Initial Benefit Priorities:")
 for i, (bt, score) in enumerate(sorted1[:5], 1):
     print(f"   {i}. {bt.value:25} {score:.1f}/100")
 
 # Adaptive questioning
 print(f"\n💬 Adaptive Questioning (max 8 questions):")
-q_count = 0
-while not engine1.should_stop() and q_count < 8:
-    q = engine1.select_next_question()
-    choice = 1 if "children" in q.text.lower() else 0  # No kids
-    engine1.process_answer(q, choice)
-    q_count += 1
-    answer_text = q.choice_a if choice == 0 else q.choice_b
-    print(f"   Q{q_count}: {q.text[:65]}")
+asked1 = engine1.run_simulation(
+    lambda q: 1 if "children" in q.keyword_tags else 0,  # No kids
+    max_questions=8
+)
+q_count = len(asked1)
+for n, (q, answer) in enumerate(zip(asked1, engine1.answers), 1):
+    answer_text = q.choice_a if answer.choice == 'A' else q.choice_b
+    print(f"   Q{n}: {q.text[:65]}")
     print(f"        → {answer_text[:60]}")
 
 recs1 = engine1.generate_recommendations()
-top5_1 = sorted(recs1, key=lambda r: r.score, reverse=True)[:5]
+score1 = {r.benefit_type: r.score for r in recs1}
+top5_1 = recs1[:5]  # already sorted by score
 
 print(f"\n✅ Final Recommendations (after {q_count} questions):")
 for i, rec in enumerate(top5_1, 1):
@@ -69,46 +61,37 @@ print("\n┌─ TEST 2: Family with Children ───────────
 print("│ Profile: Age 38, $130k income, Married, 3 children                    │")
 print("└────────────────────────────────────────────────────────────────────────┘")
 
-demo2 = UserDemographics(
-    name="Sarah Martinez", age=38, gender="Female",
-    location="Seattle, WA", zip_code="98101",
-    marital_status="married", num_children=3
-)
+demo2 = FAMILY_DEMO
 
-fin2 = UserFinancials(
-    annual_income=130000.0, monthly_expenses=8500.0,
-    total_debt=80000.0, savings=75000.0,
-    investment_accounts=150000.0,
-    spending_categories={}, income_volatility=0.08
-)
+fin2 = FAMILY_FIN
 
 engine2 = AdaptiveQuestionnaireEngine(demo2, fin2)
 
-sorted2 = sorted(engine2.benefit_scores.items(), key=lambda x: x[1], reverse=True)
+sorted2 = sorted(engine2.benefit_scores.items(), key=itemgetter(1), reverse=True)
 print(f"\n📊 Initial Benefit Priorities:")
 for i, (bt, score) in enumerate(sorted2[:5], 1):
     print(f"   {i}. {bt.value:25} {score:.1f}/100")
 
 print(f"\n💬 Adaptive Questioning (max 10 questions):")
-q_count2 = 0
-while not engine2.should_stop() and q_count2 < 10:
-    q = engine2.select_next_question()
+def family_policy(q):
     # Family-oriented answers
-    if "children" in q.text.lower() or "kids" in q.text.lower():
-        choice = 0  # Yes
-    elif "risk" in q.text.lower():
-        choice = 1  # Conservative
+    if not q.keyword_tags.isdisjoint(("children", "kids")):
+        return 0  # Yes
+    elif "risk" in q.keyword_tags:
+        return 1  # Conservative
     else:
-        choice = 0
-    
-    engine2.process_answer(q, choice)
-    q_count2 += 1
-    answer_text = q.choice_a if choice == 0 else q.choice_b
-    print(f"   Q{q_count2}: {q.text[:65]}")
+        return 0
+
+asked2 = engine2.run_simulation(family_policy, max_questions=10)
+q_count2 = len(asked2)
+for n, (q, answer) in enumerate(zip(asked2, engine2.answers), 1):
+    answer_text = q.choice_a if answer.choice == 'A' else q.choice_b
+    print(f"   Q{n}: {q.text[:65]}")
     print(f"        → {answer_text[:60]}")
 
 recs2 = engine2.generate_recommendations()
-top5_2 = sorted(recs2, key=lambda r: r.score, reverse=True)[:5]
+score2 = {r.benefit_type: r.score for r in recs2}
+top5_2 = recs2[:5]
 
 print(f"\n✅ Final Recommendations (after {q_count2} questions):")
 for i, rec in enumerate(top5_2, 1):
@@ -128,14 +111,14 @@ print("\n" + "="*80)
 print(" COMPARATIVE ANALYSIS")
 print("="*80)
 
-life1 = next((r.score for r in recs1 if r.benefit_type == BenefitType.LIFE), 0)
-life2 = next((r.score for r in recs2 if r.benefit_type == BenefitType.LIFE), 0)
+life1 = score1.get(BenefitType.LIFE, 0)
+life2 = score2.get(BenefitType.LIFE, 0)
 
-disability1 = next((r.score for r in recs1 if r.benefit_type == BenefitType.DISABILITY), 0)
-disability2 = next((r.score for r in recs2 if r.benefit_type == BenefitType.DISABILITY), 0)
+disability1 = score1.get(BenefitType.DISABILITY, 0)
+disability2 = score2.get(BenefitType.DISABILITY, 0)
 
-dependent1 = next((r.score for r in recs1 if r.benefit_type == BenefitType.DEPENDENT_CARE_FSA), 0)
-dependent2 = next((r.score for r in recs2 if r.benefit_type == BenefitType.DEPENDENT_CARE_FSA), 0)
+dependent1 = score1.get(BenefitType.DEPENDENT_CARE_FSA, 0)
+dependent2 = score2.get(BenefitType.DEPENDENT_CARE_FSA, 0)
 
 print(f"\n📈 Benefit Score Comparison:")
 print(f"\n   Life Insurance:")